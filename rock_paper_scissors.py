@@ -1,9 +1,9 @@
-"""Simple Rock-Paper-Scissors GUI using Tkinter.
+"""Rock-Paper-Scissors game logic and GUI launcher.
 
-This module provides both game logic functions and a Tkinter GUI for
-playing Rock-Paper-Scissors against a computer opponent. It tracks
-scores (wins, losses, ties) and maintains a detailed round-by-round
-history.
+This module provides the game logic for playing Rock-Paper-Scissors
+against a computer opponent, plus a `main()` entry point that opens the
+Tkinter GUI. The GUI itself (the RPSApp class in rps_gui.py) tracks
+scores (wins, losses, ties) and keeps a round-by-round history.
 
 Quick Start
 -----------
@@ -11,26 +11,134 @@ Quick Start
 
 The GUI displays three buttons (Rock, Paper, Scissors), a result label,
 detailed scoreboard (player wins, computer wins, ties), and a scrollable
-round history. Use Reset to clear scores or Quit to exit.
+round history. Use Reset to clear scores or Quit to exit. The keys 1/2/3
+(or r/p/s) play Rock, Paper and Scissors from the keyboard.
 
 Module API
 ----------
 For importing into other programs:
     - `get_computer_choice() -> str`
         Returns a random move: 'rock', 'paper', or 'scissors'.
+    - `get_computer_choice_id(getrandbits=random.getrandbits) -> int`
+        Returns a random move id: 0 (rock), 1 (paper) or 2 (scissors).
+    - `move_id(move: str) -> int`
+        Returns the id of a move name. Raises ValueError if it is invalid.
+    - `determine_winner_id(player: int, computer: int) -> int`
+        Determines the round winner from move ids; returns an outcome id.
+    - `MOVE_NAMES`, `OUTCOMES`
+        Tuples mapping move ids and outcome ids back to their names.
     - `determine_winner(player: str, computer: str) -> str`
         Determines the round winner. Raises ValueError if inputs are invalid.
+    - `simulate(n: int) -> tuple[int, int, int]`
+        Plays n random rounds headlessly; returns (player, computer, ties).
 
 Design Notes
 ------------
-Game logic is intentionally separate from the GUI (RPSApp class) so the
-logic can be imported and tested independently. The GUI only launches
-when __name__ == '__main__', making safe imports possible.
+Game logic is intentionally separate from the GUI (RPSApp class, in
+rps_gui.py) so the logic can be imported and tested independently. The
+GUI only launches when __name__ == '__main__', making safe imports
+possible, and tkinter itself is only imported once the GUI is used.
 """
 
 import random
-import tkinter as tk
-from typing import Literal
+from typing import Callable, Final, Literal
+
+# Move names shared by the lookup tables and the GUI.
+ROCK: Final = 'rock'
+PAPER: Final = 'paper'
+SCISSORS: Final = 'scissors'
+
+# Moves are encoded as small ints (0=rock, 1=paper, 2=scissors) so that the
+# winner reduces to (player - computer) % 3: 0 is a tie, 1 a player win and
+# 2 a computer win. MOVE_NAMES and OUTCOMES map those ids back to names; the
+# string API below is a thin wrapper over these.
+MOVE_NAMES: tuple[Literal['rock', 'paper', 'scissors'], ...] = (ROCK, PAPER, SCISSORS)
+_MOVE_ID = {ROCK: 0, PAPER: 1, SCISSORS: 2}
+OUTCOMES: tuple[Literal['player', 'computer', 'tie'], ...] = ('tie', 'player', 'computer')
+_getrandbits = random.getrandbits
+
+
+def get_computer_choice_id(getrandbits: Callable[[int], int] = _getrandbits) -> int:
+    """Return a random move id for the computer.
+
+    Parameters
+    ----------
+    getrandbits : Callable[[int], int], optional
+        Source of random bits, e.g. the bound ``getrandbits`` method of a
+        ``random.Random`` instance. Defaults to the module-level generator.
+
+    Returns
+    -------
+    int
+        A uniformly random move id: 0 (rock), 1 (paper) or 2 (scissors).
+
+    Examples
+    --------
+    >>> get_computer_choice_id() in (0, 1, 2)
+    True
+    >>> import random
+    >>> get_computer_choice_id(random.Random(0).getrandbits) in (0, 1, 2)
+    True
+    """
+    # Draw 2 bits and reject the out-of-range value 3; this keeps the
+    # distribution uniform without going through random.choice.
+    while True:
+        i = getrandbits(2)
+        if i < 3:
+            return i
+
+
+def determine_winner_id(player: int, computer: int) -> int:
+    """Determine the winner of a round given as move ids.
+
+    Parameters
+    ----------
+    player : int
+        Player's move id (an index into MOVE_NAMES).
+    computer : int
+        Computer's move id (an index into MOVE_NAMES).
+
+    Returns
+    -------
+    int
+        The outcome id, an index into OUTCOMES: 0 (tie), 1 (player) or
+        2 (computer).
+
+    Examples
+    --------
+    >>> OUTCOMES[determine_winner_id(move_id('rock'), move_id('scissors'))]
+    'player'
+    """
+    return (player - computer) % 3
+
+
+def move_id(move: str) -> int:
+    """Return the id of a move name.
+
+    Parameters
+    ----------
+    move : str
+        One of 'rock', 'paper' or 'scissors'.
+
+    Returns
+    -------
+    int
+        The move id: 0 (rock), 1 (paper) or 2 (scissors).
+
+    Raises
+    ------
+    ValueError
+        If move is not a valid move.
+
+    Examples
+    --------
+    >>> move_id('paper')
+    1
+    """
+    try:
+        return _MOVE_ID[move]
+    except KeyError:
+        raise ValueError(f"Invalid move: {move!r}; expected one of {sorted(_MOVE_ID)}") from None
 
 
 def get_computer_choice() -> Literal['rock', 'paper', 'scissors']:
@@ -41,7 +149,7 @@ def get_computer_choice() -> Literal['rock', 'paper', 'scissors']:
     Literal['rock', 'paper', 'scissors']
         A uniformly random move.
     """
-    return random.choice(['rock', 'paper', 'scissors'])
+    return MOVE_NAMES[get_computer_choice_id()]
 
 
 def determine_winner(
@@ -76,201 +184,46 @@ def determine_winner(
     >>> determine_winner('rock', 'rock')
     'tie'
     """
-    valid = {'rock', 'paper', 'scissors'}
-    if player not in valid or computer not in valid:
-        raise ValueError(f"Invalid moves: player={player!r}, computer={computer!r}; expected one of {sorted(valid)}")
-
-    if player == computer:
-        return 'tie'
+    try:
+        p = _MOVE_ID[player]
+        c = _MOVE_ID[computer]
+    except KeyError:
+        raise ValueError(f"Invalid moves: player={player!r}, computer={computer!r}; expected one of {sorted(_MOVE_ID)}") from None
+    return OUTCOMES[determine_winner_id(p, c)]
 
-    beats = {'rock': 'scissors', 'scissors': 'paper', 'paper': 'rock'}
-    return 'player' if beats[player] == computer else 'computer'
 
+def simulate(n: int) -> tuple[int, int, int]:
+    """Play n rounds of random moves against each other without the GUI.
 
-class RPSApp:
-    """Tkinter GUI for Rock-Paper-Scissors.
-
-    Displays a simple interface with three move buttons, a result label,
-    a detailed scoreboard (player/computer/ties), and a scrollable round
-    history. Tracks and displays scores across multiple rounds.
-
-    Attributes
+    Parameters
     ----------
-    root : tk.Tk
-        The root window.
-    player_score : int
-        Number of rounds won by the player.
-    computer_score : int
-        Number of rounds won by the computer.
-    ties : int
-        Number of tied rounds.
-    round : int
-        Total number of rounds played.
+    n : int
+        Number of rounds to play.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        Player wins, computer wins and ties, in that order.
 
     Examples
     --------
-    >>> import tkinter as tk
-    >>> root = tk.Tk()
-    >>> app = RPSApp(root)
-    >>> # User can now click buttons. Call root.destroy() to close.
+    >>> sum(simulate(1000))
+    1000
     """
+    tallies = [0, 0, 0]
+    choice = get_computer_choice_id
+    for _ in range(n):
+        tallies[determine_winner_id(choice(), choice())] += 1
+    ties, player, computer = tallies
+    return player, computer, ties
 
-    def __init__(self, root: tk.Tk) -> None:
-        """Initialize the RPSApp with a Tkinter root window.
-
-        Parameters
-        ----------
-        root : tk.Tk
-            The root Tkinter window.
-        """
-        self.root = root
-        root.title('Rock Paper Scissors')
-        root.resizable(False, False)
-
-        self.player_score = 0
-        self.ties = 0
-        self.computer_score = 0
-        self.round = 0
-
-        self._build_ui()
-
-    def _build_ui(self) -> None:
-        """Construct the GUI components.
-
-        Creates the layout: a title label, choice display, three move buttons,
-        result label, detailed scoreboard (player/computer/ties), a scrollable
-        round history listbox, and Reset/Quit control buttons.
-
-        This method is called once during __init__ and is not typically called
-        directly by users.
-        """
-        pad = 8
-        top = tk.Frame(self.root, padx=pad, pady=pad)
-        top.pack()
-
-        self.info_label = tk.Label(top, text='Choose your move', font=('Segoe UI', 14))
-        self.info_label.pack(pady=(0, 6))
-
-        self.choices_label = tk.Label(top, text='', font=('Segoe UI', 11))
-        self.choices_label.pack()
-
-        btn_frame = tk.Frame(top, pady=6)
-        btn_frame.pack()
-
-        tk.Button(btn_frame, text='Rock', width=10, command=lambda: self.play('rock')).grid(row=0, column=0, padx=4)
-        tk.Button(btn_frame, text='Paper', width=10, command=lambda: self.play('paper')).grid(row=0, column=1, padx=4)
-        tk.Button(btn_frame, text='Scissors', width=10, command=lambda: self.play('scissors')).grid(row=0, column=2, padx=4)
-
-        self.result_label = tk.Label(top, text='', font=('Segoe UI', 12, 'bold'))
-        self.result_label.pack(pady=(8, 4))
-
-        # Detailed scoreboard: separate labels for player, computer and ties
-        score_frame = tk.Frame(top)
-        score_frame.pack()
-
-        self.player_score_label = tk.Label(score_frame, text=f'You: {self.player_score}', font=('Segoe UI', 10))
-        self.player_score_label.grid(row=0, column=0, padx=8)
-
-        self.computer_score_label = tk.Label(score_frame, text=f'Computer: {self.computer_score}', font=('Segoe UI', 10))
-        self.computer_score_label.grid(row=0, column=1, padx=8)
-
-        self.ties_label = tk.Label(score_frame, text=f'Ties: {self.ties}', font=('Segoe UI', 10))
-        self.ties_label.grid(row=0, column=2, padx=8)
-
-        # Round history (detailed per-round scoreboard)
-        history_frame = tk.Frame(top)
-        history_frame.pack(pady=(6, 0), fill=tk.BOTH)
-
-        tk.Label(history_frame, text='Round History', font=('Segoe UI', 10, 'underline')).pack(anchor='w')
-        hist_box_frame = tk.Frame(history_frame)
-        hist_box_frame.pack(fill=tk.BOTH)
-
-        self.history_listbox = tk.Listbox(hist_box_frame, width=64, height=8)
-        self.history_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        hist_scroll = tk.Scrollbar(hist_box_frame, orient=tk.VERTICAL, command=self.history_listbox.yview)
-        hist_scroll.pack(side=tk.LEFT, fill=tk.Y)
-        self.history_listbox.config(yscrollcommand=hist_scroll.set)
-
-        ctrl_frame = tk.Frame(top, pady=6)
-        ctrl_frame.pack()
-        tk.Button(ctrl_frame, text='Reset', command=self.reset_scores).grid(row=0, column=0, padx=6)
-        tk.Button(ctrl_frame, text='Quit', command=self.root.destroy).grid(row=0, column=1, padx=6)
-
-    def _score_text(self):
-        return f'Score — You: {self.player_score}   Computer: {self.computer_score}'
-
-    def play(self, player_choice: Literal['rock', 'paper', 'scissors']) -> None:
-        """Execute one round of the game.
-
-        Prompts the computer to select a move, determines the winner,
-        increments the round counter, updates the scoreboard, and appends
-        a history entry.
-
-        Parameters
-        ----------
-        player_choice : Literal['rock', 'paper', 'scissors']
-            The player's move. Must be one of the three valid moves.
-
-        Raises
-        ------
-        ValueError
-            If player_choice is not a valid move (propagated from determine_winner).
-        """
-        computer_choice = get_computer_choice()
-        winner = determine_winner(player_choice, computer_choice)
-
-        self.choices_label.config(text=f'You chose: {player_choice}    Computer chose: {computer_choice}')
-
-        # update round counter and scoreboard
-        self.round += 1
-        if winner == 'player':
-            self.player_score += 1
-            self.result_label.config(text='You win!', fg='green')
-            outcome_text = 'Player'
-        elif winner == 'computer':
-            self.computer_score += 1
-            self.result_label.config(text='Computer wins!', fg='red')
-            outcome_text = 'Computer'
-        else:
-            self.ties += 1
-            self.result_label.config(text="It's a tie!", fg='gray')
-            outcome_text = 'Tie'
-
-        # update labels
-        self.player_score_label.config(text=f'You: {self.player_score}')
-        self.computer_score_label.config(text=f'Computer: {self.computer_score}')
-        self.ties_label.config(text=f'Ties: {self.ties}')
-
-        # append round to history
-        self.history_listbox.insert(tk.END, f'Round {self.round}: You={player_choice}  Computer={computer_choice}  => {outcome_text}')
-        # auto-scroll to last
-        self.history_listbox.yview_moveto(1.0)
-
-    def reset_scores(self) -> None:
-        """Reset all scores and round history.
-
-        Clears player wins, computer wins, ties, the round counter, all UI labels,
-        and the round history listbox. Called when the user clicks the Reset button.
-        """
-        self.player_score = 0
-        self.computer_score = 0
-        self.ties = 0
-        self.round = 0
-        self.player_score_label.config(text=f'You: {self.player_score}')
-        self.computer_score_label.config(text=f'Computer: {self.computer_score}')
-        self.ties_label.config(text=f'Ties: {self.ties}')
-        self.choices_label.config(text='')
-        self.result_label.config(text='')
-        # clear history
-        self.history_listbox.delete(0, tk.END)
-
-
-def main():
-    root = tk.Tk()
-    app = RPSApp(root)
-    root.mainloop()
+
+def main() -> None:
+    """Launch the Tkinter GUI (see rps_gui.RPSApp)."""
+    from rps_gui import main as gui_main
+
+    gui_main()
 
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,302 @@
+"""Tkinter GUI for Rock-Paper-Scissors.
+
+Holds the RPSApp window on top of the game logic in rock_paper_scissors.
+It is kept in its own module so that tkinter is only imported when the
+GUI is used, and so the optional mypyc build of rock_paper_scissors
+compiles just the game logic.
+"""
+
+import random
+import tkinter as tk
+from tkinter import font as tkfont
+from typing import Callable, Literal, Optional
+
+from rock_paper_scissors import (
+    MOVE_NAMES,
+    PAPER,
+    ROCK,
+    SCISSORS,
+    determine_winner_id,
+    get_computer_choice_id,
+    move_id,
+)
+
+
+class RPSApp:
+    """Tkinter GUI for Rock-Paper-Scissors.
+
+    Displays a simple interface with three move buttons, a result label,
+    a detailed scoreboard (player/computer/ties), and a scrollable round
+    history. Tracks and displays scores across multiple rounds.
+
+    Attributes
+    ----------
+    root : tk.Tk
+        The root window.
+    player_score : int
+        Number of rounds won by the player.
+    computer_score : int
+        Number of rounds won by the computer.
+    ties : int
+        Number of tied rounds.
+    round : int
+        Total number of rounds played.
+
+    Only the most recent 500 rounds are kept in the history log.
+
+    Examples
+    --------
+    >>> import tkinter as tk
+    >>> root = tk.Tk()
+    >>> app = RPSApp(root)
+    >>> # User can now click buttons. Call root.destroy() to close.
+    """
+
+    # Fixed scoreboard prefixes; only the number after them changes per round.
+    _P_PREFIX = 'You: '
+    _C_PREFIX = 'Computer: '
+    _T_PREFIX = 'Ties: '
+
+    # Per-outcome (message, colour, history text, score attribute), indexed
+    # by the outcome id from determine_winner_id (see OUTCOMES).
+    _WINNER_DISPATCH = (
+        ("It's a tie!", 'gray', 'Tie', 'ties'),
+        ('You win!', 'green', 'Player', 'player_score'),
+        ('Computer wins!', 'red', 'Computer', 'computer_score'),
+    )
+
+    def __init__(self, root: tk.Tk) -> None:
+        """Initialize the RPSApp with a Tkinter root window.
+
+        Parameters
+        ----------
+        root : tk.Tk
+            The root Tkinter window.
+        """
+        self.root = root
+        root.title('Rock Paper Scissors')
+        root.resizable(False, False)
+
+        self.player_score = 0
+        self.ties = 0
+        self.computer_score = 0
+        self.round = 0
+        # Private generator for the computer's moves, separate from the
+        # module-level one shared with other users of `random`.
+        self._rng_bits = random.Random().getrandbits
+        # Maximum number of rounds kept in the history log; the oldest
+        # entry is dropped once the limit is reached.
+        self._history_max = 500
+        self._history_len = 0
+        # Display updates queued by play and written out by _flush_ui.
+        self._pending: Optional[tuple[str, str, tuple[str, str, str, str]]] = None
+        self._history_queue: list[str] = []
+        self._flush_id: Optional[str] = None
+
+        self._build_ui()
+
+    def _build_ui(self) -> None:
+        """Construct the GUI components.
+
+        Creates the layout: a title label, choice display, three move buttons,
+        result label, detailed scoreboard (player/computer/ties), a scrollable
+        round history log, and Reset/Quit control buttons.
+
+        This method is called once during __init__ and is not typically called
+        directly by users.
+        """
+        # Font objects are created once and shared by every widget that uses
+        # them, instead of passing a font tuple that Tk parses per widget.
+        self._f_title = tkfont.Font(family='Segoe UI', size=14)
+        self._f_choices = tkfont.Font(family='Segoe UI', size=11)
+        self._f_result = tkfont.Font(family='Segoe UI', size=12, weight='bold')
+        self._f_small = tkfont.Font(family='Segoe UI', size=10)
+        self._f_heading = tkfont.Font(family='Segoe UI', size=10, underline=True)
+
+        # Every widget is gridded directly into a single container frame.
+        # Columns 0 and 5 are stretchy spacers that keep the buttons and
+        # scoreboard grouped in the middle; the middle move (Paper) spans the
+        # equal-width columns 2-3 so Reset/Quit can meet at its centre line.
+        # Column 6 holds the history scrollbar.
+        pad = 8
+        container = tk.Frame(self.root, padx=pad, pady=pad)
+        container.grid(row=0, column=0)
+        container.grid_columnconfigure((0, 5), weight=1)
+        container.grid_columnconfigure((2, 3), uniform='mid')
+
+        self.info_label = tk.Label(container, text='Choose your move', font=self._f_title)
+        self.info_label.grid(row=0, column=0, columnspan=6, pady=(0, 6))
+
+        # Labels that change every round are bound to StringVars so updates
+        # only touch the variable and Tk redraws the label at idle time. The
+        # result label keeps using config() since its colour changes too.
+        self.v_choices = tk.StringVar(value='')
+        self.v_player = tk.StringVar(value=self._P_PREFIX + str(self.player_score))
+        self.v_computer = tk.StringVar(value=self._C_PREFIX + str(self.computer_score))
+        self.v_ties = tk.StringVar(value=self._T_PREFIX + str(self.ties))
+
+        self.choices_label = tk.Label(container, textvariable=self.v_choices, font=self._f_choices)
+        self.choices_label.grid(row=1, column=0, columnspan=6)
+
+        tk.Button(container, text='Rock', width=10, command=lambda: self.play(ROCK)).grid(row=2, column=1, padx=4, pady=6)
+        tk.Button(container, text='Paper', width=10, command=lambda: self.play(PAPER)).grid(row=2, column=2, columnspan=2, padx=4, pady=6)
+        tk.Button(container, text='Scissors', width=10, command=lambda: self.play(SCISSORS)).grid(row=2, column=4, padx=4, pady=6)
+
+        # Keyboard shortcuts: 1/2/3 and r/p/s (either case) play a move directly
+        shortcuts: tuple[tuple[str, Literal['rock', 'paper', 'scissors']], ...] = (
+            ('1rR', ROCK), ('2pP', PAPER), ('3sS', SCISSORS),
+        )
+        for keys, move in shortcuts:
+            handler = self._key_handler(move)
+            for key in keys:
+                self.root.bind(key, handler)
+
+        self.result_label = tk.Label(container, text='', font=self._f_result)
+        self.result_label.grid(row=3, column=0, columnspan=6, pady=(8, 4))
+
+        # Detailed scoreboard: separate labels for player, computer and ties
+        self.player_score_label = tk.Label(container, textvariable=self.v_player, font=self._f_small)
+        self.player_score_label.grid(row=4, column=1, padx=8)
+
+        self.computer_score_label = tk.Label(container, textvariable=self.v_computer, font=self._f_small)
+        self.computer_score_label.grid(row=4, column=2, columnspan=2, padx=8)
+
+        self.ties_label = tk.Label(container, textvariable=self.v_ties, font=self._f_small)
+        self.ties_label.grid(row=4, column=4, padx=8)
+
+        # Round history (detailed per-round scoreboard)
+        tk.Label(container, text='Round History', font=self._f_heading).grid(row=5, column=0, columnspan=6, pady=(6, 0), sticky='w')
+
+        # Read-only Text used as an append-only log; it copes with long
+        # histories better than a Listbox. It is only enabled while editing.
+        self.history = tk.Text(container, width=64, height=8, state='disabled', wrap='none')
+        self.history.grid(row=6, column=0, columnspan=6, sticky='nsew')
+        hist_scroll = tk.Scrollbar(container, orient=tk.VERTICAL, command=self.history.yview)
+        hist_scroll.grid(row=6, column=6, sticky='ns')
+        self.history.config(yscrollcommand=hist_scroll.set)
+
+        # Reset and Quit sit side by side, meeting at the centre of Paper
+        tk.Button(container, text='Reset', command=self.reset_scores).grid(row=7, column=1, columnspan=2, padx=6, pady=6, sticky='e')
+        tk.Button(container, text='Quit', command=self.root.destroy).grid(row=7, column=3, columnspan=2, padx=6, pady=6, sticky='w')
+
+    def _key_handler(self, move: Literal['rock', 'paper', 'scissors']) -> Callable[[tk.Event], None]:
+        """Return a key-event callback that plays move."""
+        play = self.play
+
+        def handler(event: tk.Event) -> None:
+            play(move)
+
+        return handler
+
+    def _score_text(self):
+        return f'Score \u2014 You: {self.player_score}   Computer: {self.computer_score}'
+
+    def play(self, player_choice: Literal['rock', 'paper', 'scissors']) -> None:
+        """Execute one round of the game.
+
+        Prompts the computer to select a move, determines the winner,
+        increments the round counter and scores, and schedules the
+        scoreboard and history update for the next idle tick.
+
+        Parameters
+        ----------
+        player_choice : Literal['rock', 'paper', 'scissors']
+            The player's move. Must be one of the three valid moves.
+
+        Raises
+        ------
+        ValueError
+            If player_choice is not a valid move.
+        """
+        player_id = move_id(player_choice)
+        computer_id = get_computer_choice_id(self._rng_bits)
+        result = self._WINNER_DISPATCH[determine_winner_id(player_id, computer_id)]
+        player_name = MOVE_NAMES[player_id]
+        computer_name = MOVE_NAMES[computer_id]
+
+        # update round counter and scores
+        self.round += 1
+        outcome_text, attr = result[2], result[3]
+        setattr(self, attr, getattr(self, attr) + 1)
+
+        # queue the display update; rapid clicks are coalesced into a single
+        # redraw by _flush_ui on the next idle tick
+        self._pending = (player_name, computer_name, result)
+        self._history_queue.append(''.join(('Round ', str(self.round), ': You=', player_name, '  Computer=', computer_name, '  => ', outcome_text)))
+        if self._flush_id is None:
+            self._flush_id = self.root.after_idle(self._flush_ui)
+
+    def _flush_ui(self) -> None:
+        """Write queued round results to the widgets.
+
+        Scheduled by play via after_idle. Only the latest round is shown in
+        the choices/result labels, while every queued round is appended to
+        the history log in one call.
+        """
+        self._flush_id = None
+        if self._pending is not None:
+            player_choice, computer_choice, result = self._pending
+            self._pending = None
+            self.v_choices.set(f'You chose: {player_choice}    Computer chose: {computer_choice}')
+            self.result_label.config(text=result[0], fg=result[1])
+
+        # update labels
+        self.v_player.set(self._P_PREFIX + str(self.player_score))
+        self.v_computer.set(self._C_PREFIX + str(self.computer_score))
+        self.v_ties.set(self._T_PREFIX + str(self.ties))
+
+        if not self._history_queue:
+            return
+        # append queued rounds to history, dropping the oldest entries when full
+        lines = self._history_queue[-self._history_max:]
+        self._history_queue.clear()
+        history, END = self.history, tk.END
+        at_bottom = history.yview()[1] > 0.999
+        history.config(state='normal')
+        history.insert(END, '\n'.join(lines) + '\n')
+        self._history_len += len(lines)
+        overflow = self._history_len - self._history_max
+        if overflow > 0:
+            history.delete('1.0', f'{overflow + 1}.0')
+            self._history_len = self._history_max
+        history.config(state='disabled')
+        # auto-scroll to last, unless the user scrolled up to read older rounds
+        if at_bottom:
+            history.see(END)
+
+    def reset_scores(self) -> None:
+        """Reset all scores and round history.
+
+        Clears player wins, computer wins, ties, the round counter, all UI labels,
+        and the round history log. Called when the user clicks the Reset button.
+        """
+        self.player_score = 0
+        self.computer_score = 0
+        self.ties = 0
+        self.round = 0
+        # drop any display update still queued by play
+        if self._flush_id is not None:
+            self.root.after_cancel(self._flush_id)
+            self._flush_id = None
+        self._pending = None
+        self._history_queue.clear()
+        self.v_player.set(self._P_PREFIX + str(self.player_score))
+        self.v_computer.set(self._C_PREFIX + str(self.computer_score))
+        self.v_ties.set(self._T_PREFIX + str(self.ties))
+        self.v_choices.set('')
+        self.result_label.config(text='')
+        # clear history
+        self.history.config(state='normal')
+        self.history.delete('1.0', tk.END)
+        self.history.config(state='disabled')
+        self._history_len = 0
+
+
+def main() -> None:
+    root = tk.Tk()
+    app = RPSApp(root)
+    root.mainloop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+"""Optional build script for rock_paper_scissors.
+
+By default this installs the pure-Python modules. Set RPS_USE_MYPYC=1 to
+compile the game logic (rock_paper_scissors) with mypyc instead (requires
+`pip install mypy`); the compiled extension is picked up by
+`import rock_paper_scissors` in place of the .py file. The Tkinter GUI in
+rps_gui is never compiled and always runs as plain Python.
+
+    RPS_USE_MYPYC=1 python setup.py build_ext --inplace
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get('RPS_USE_MYPYC') == '1':
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(['rock_paper_scissors.py'])
+
+setup(
+    name='rock_paper_scissors',
+    version='0.1.0',
+    description='Rock-Paper-Scissors game logic and Tkinter GUI',
+    py_modules=['rock_paper_scissors', 'rps_gui'],
+    ext_modules=ext_modules,
+    python_requires='>=3.9',
+)